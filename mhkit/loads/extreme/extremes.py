@@ -67,9 +67,32 @@ def ste_peaks(peaks_distribution: rv_continuous, npeaks: float) -> rv_continuous
         def _cdf(self, x, *args, **kwargs):
             peaks_cdf = np.array(self.peaks.cdf(x, *args, **kwargs))
             peaks_cdf[np.isnan(peaks_cdf)] = 0.0
+            peaks_cdf = np.clip(peaks_cdf, 0.0, 1.0)
             if len(peaks_cdf) == 1:
                 peaks_cdf = peaks_cdf[0]
-            return peaks_cdf**self.npeaks
+            # peaks_cdf**npeaks via exp/log, which is faster for large,
+            # non-integer npeaks; log(0) = -inf correctly maps to 0
+            with np.errstate(divide="ignore"):
+                return np.exp(self.npeaks * np.log(peaks_cdf))
+
+        def _pdf(self, x, *args, **kwargs):
+            # derivative of peaks_cdf**npeaks
+            peaks_cdf = np.array(self.peaks.cdf(x, *args, **kwargs))
+            peaks_cdf[np.isnan(peaks_cdf)] = 0.0
+            peaks_cdf = np.clip(peaks_cdf, 0.0, 1.0)
+            peaks_pdf = np.array(self.peaks.pdf(x, *args, **kwargs))
+            peaks_pdf[np.isnan(peaks_pdf)] = 0.0
+            with np.errstate(divide="ignore"):
+                return (
+                    self.npeaks
+                    * np.exp((self.npeaks - 1.0) * np.log(peaks_cdf))
+                    * peaks_pdf
+                )
+
+        def _ppf(self, q, *args, **kwargs):
+            # invert peaks_cdf**npeaks through the peaks distribution
+            # rather than numerically root finding _cdf
+            return self.peaks.ppf(q ** (1.0 / self.npeaks), *args, **kwargs)
 
     short_term_extreme_peaks = _ShortTermExtreme(
         name="short_term_extreme", peaks_distribution=peaks_distribution, npeaks=npeaks
@@ -110,12 +133,25 @@ def block_maxima(
         raise TypeError(f"time_st must be of type float. Got: {type(time_st)}")
 
     nblock = int(time[-1] / time_st)
-    block_max = np.zeros(int(nblock))
-    for iblock in range(nblock):
-        i_x = global_peaks_data[
-            (time >= iblock * time_st) & (time < (iblock + 1) * time_st)
-        ]
-        block_max[iblock] = np.max(i_x)
+
+    # Assign every point to its block in a single pass and reduce each
+    # contiguous block with one call instead of masking the full array
+    # once per block.
+    block_index = np.floor(time / time_st).astype(np.intp)
+    in_blocks = (block_index >= 0) & (block_index < nblock)
+    block_index = block_index[in_blocks]
+    block_data = global_peaks_data[in_blocks]
+    if np.any(np.diff(block_index) < 0):
+        order = np.argsort(block_index, kind="stable")
+        block_index = block_index[order]
+        block_data = block_data[order]
+
+    starts = np.searchsorted(block_index, np.arange(nblock))
+    block_sizes = np.diff(np.append(starts, block_index.size))
+    if np.any(block_sizes == 0):
+        raise ValueError("Each block of length time_st must contain data.")
+
+    block_max = np.maximum.reduceat(block_data, starts)
     return block_max
 
 
@@ -275,19 +311,22 @@ def full_seastate_long_term_extreme(short_term_extreme_dist, weights):
 
     class _LongTermExtreme(stats.rv_continuous):
         def __init__(self, *args, **kwargs):
-            weights = kwargs.pop("weights")
+            weights = np.asarray(kwargs.pop("weights"), dtype=float)
             # make sure weights add to 1.0
             self.weights = weights / np.sum(weights)
-            self.ste = kwargs.pop("ste")
+            self.ste = tuple(kwargs.pop("ste"))
             # Disabled bc not sure where/ how n is applied
             self.n = len(self.weights)  # pylint: disable=invalid-name
             super().__init__(*args, **kwargs)
 
         def _cdf(self, x, *args, **kwargs):
-            weighted_cdf = 0.0
-            for w_i, ste_i in zip(self.weights, self.ste):
-                weighted_cdf += w_i * ste_i.cdf(x, *args, **kwargs)
-            return weighted_cdf
+            x = np.asarray(x)
+            # Evaluate every short-term CDF into one matrix and weight
+            # them with a single matrix-vector product
+            cdf_matrix = np.empty((self.n, x.size))
+            for i, ste_i in enumerate(self.ste):
+                cdf_matrix[i] = np.ravel(ste_i.cdf(x, *args, **kwargs))
+            return (self.weights @ cdf_matrix).reshape(x.shape)
 
     return _LongTermExtreme(
         name="long_term_extreme", weights=weights, ste=short_term_extreme_dist
@@ -15,18 +15,58 @@ design and risk assessment. It includes functions to:
     visualization.
 """
 
-from typing import Union, List, Optional, Dict, Any
+from typing import Union, List, Optional, Dict, Any, Tuple
 
 import pandas as pd
 import xarray as xr
 import numpy as np
 from numpy.typing import NDArray
 
-from mhkit.wave.resource import frequency_moment
+try:
+    import numexpr
+except ImportError:
+    # numexpr is optional; NumPy is used when it is not installed.
+    numexpr = None
 
 SimulationParameters = Dict[str, Union[float, int, np.ndarray]]
 
 
+def _cos_sin_phase(
+    shift: np.ndarray, rate: np.ndarray, offset: Union[np.ndarray, float] = 0.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluates the cosine and sine of the phase `shift * rate + offset`
+    on the outer product of `shift` and `rate`.
+
+    Parameters
+    ----------
+    shift : numpy ndarray
+        Time or space offsets from the maximum event, length M.
+    rate : numpy ndarray
+        Angular frequency or wave number, length N.
+    offset : numpy ndarray or float
+        Phase added to each frequency component, length N.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Cosine and sine of the phase, each of shape (M, N).
+    """
+    shift = np.asarray(shift, dtype=float)[:, None]
+    rate = np.asarray(rate, dtype=float)[None, :]
+    offset = np.asarray(offset, dtype=float)
+    if numexpr is None:
+        phase = shift * rate + offset
+        return np.cos(phase), np.sin(phase)
+
+    # numexpr fuses the phase construction with the trigonometric
+    # evaluation and runs it multi-threaded without temporaries
+    return (
+        numexpr.evaluate("cos(shift * rate + offset)"),
+        numexpr.evaluate("sin(shift * rate + offset)"),
+    )
+
+
 def _calculate_spectral_values(
     freq_hz: Union[np.ndarray, pd.Series],
     rao_array: np.ndarray,
@@ -60,10 +100,16 @@ def _calculate_spectral_values(
     # Response spectrum [(response units)^2-s/rad] -- Quon2016 Eqn. 3
     spectrum_r = np.abs(rao_array) ** 2 * (2 * wave_spectrum)
 
-    # Calculate spectral moments
-    m_0 = frequency_moment(pd.Series(spectrum_r, index=freq_hz), 0).iloc[0, 0]
-    m_1 = frequency_moment(pd.Series(spectrum_r, index=freq_hz), 1).iloc[0, 0]
-    m_2 = frequency_moment(pd.Series(spectrum_r, index=freq_hz), 2).iloc[0, 0]
+    # Calculate spectral moments as in mhkit.wave.resource.frequency_moment:
+    # omit the zero frequency and weight each value by the width of the
+    # preceding bin (the first bin takes the width of the second)
+    nonzero = freq_hz >= 1e-12
+    freq_nonzero = freq_hz[nonzero]
+    spectrum_nonzero = spectrum_r[nonzero]
+    delta_f = np.diff(freq_nonzero, prepend=2 * freq_nonzero[0] - freq_nonzero[1])
+    m_0 = np.nansum(spectrum_nonzero * delta_f)
+    m_1 = np.nansum(spectrum_nonzero * freq_nonzero * delta_f)
+    m_2 = np.nansum(spectrum_nonzero * freq_nonzero**2 * delta_f)
 
     # Calculate coefficient A_{R,n}
     coeff_a_rn = (
@@ -255,17 +301,24 @@ def mler_simulation(
     else:
         sim = parameters
 
+    # Time and space arrays with exactly the prescribed step. Half a step
+    # is added to the end so floating point error does not drop the end
+    # point when the range is a multiple of the step.
+    sim["T"] = np.arange(
+        sim["startTime"], sim["endTime"] + 0.5 * sim["dT"], sim["dT"], dtype=float
+    )
     # maximum timestep index
-    sim["maxIT"] = int(np.ceil((sim["endTime"] - sim["startTime"]) / sim["dT"] + 1))
-    sim["T"] = np.linspace(sim["startTime"], sim["endTime"], sim["maxIT"])
+    sim["maxIT"] = sim["T"].size
 
-    sim["maxIX"] = int(np.ceil((sim["endX"] - sim["startX"]) / sim["dX"] + 1))
-    sim["X"] = np.linspace(sim["startX"], sim["endX"], sim["maxIX"])
+    sim["X"] = np.arange(
+        sim["startX"], sim["endX"] + 0.5 * sim["dX"], sim["dX"], dtype=float
+    )
+    sim["maxIX"] = sim["X"].size
 
     return sim
 
 
-def mler_wave_amp_normalize(
+def mler_wave_amp_normalize(  # pylint: disable=R0914
     wave_amp: float,
     mler: Union[pd.DataFrame, xr.Dataset],
     sim: SimulationParameters,
@@ -320,44 +373,38 @@ def mler_wave_amp_normalize(
         raise TypeError(f"to_pandas must be of type bool. Got: {type(to_pandas)}")
 
     # If input is pandas, convert to xarray
-    mler_xr = mler.to_xarray() if isinstance(mler, pd.DataFrame) else mler()
+    mler_xr = mler.to_xarray() if isinstance(mler, pd.DataFrame) else mler
 
     # Determine frequency dimension
-    freq_dim = frequency_dimension or list(mler_xr.coords)[0]
-    # freq = mler_xr.coords[freq_dim].values * 2 * np.pi
-    # d_w = np.diff(freq).mean()
-
-    wave_amp_time = np.array(
-        [
-            np.sum(
-                np.sqrt(
-                    2
-                    * mler_xr["WaveSpectrum"].values
-                    * np.diff(mler_xr.coords[freq_dim].values * 2 * np.pi).mean()
-                )
-                * np.cos(
-                    mler_xr.coords[freq_dim].values * 2 * np.pi * (t - sim["T0"])
-                    - k_array * (x - sim["X0"])
-                    + mler_xr["Phase"].values
-                )
-            )
-            for x in np.linspace(sim["startX"], sim["endX"], sim["maxIX"])
-            for t in np.linspace(sim["startTime"], sim["endTime"], sim["maxIT"])
-        ]
-    ).reshape(sim["maxIX"], sim["maxIT"])
+    frequency_dimension = frequency_dimension or list(mler_xr.coords)[0]
+    freq = mler_xr.coords[frequency_dimension].values * 2 * np.pi
+    # Read the coefficients out of the dataset once
+    wave_spectrum = mler_xr["WaveSpectrum"].values
+    phase = mler_xr["Phase"].values
+    amplitude = np.sqrt(2 * wave_spectrum * np.diff(freq).mean())
+
+    # Phase of each frequency component in time and space
+    cos_time, sin_time = _cos_sin_phase(sim["T"] - sim["T0"], freq, phase)
+    cos_space, sin_space = _cos_sin_phase(sim["X"] - sim["X0"], k_array)
+
+    # Sum over frequency of amplitude * cos(phase_time - phase_space) for
+    # every (x, t) pair. Expanding the cosine of the difference turns the
+    # triple loop into two (maxIX, nfreq) x (nfreq, maxIT) products.
+    wave_amp_time = (amplitude * cos_space) @ cos_time.T + (
+        amplitude * sin_space
+    ) @ sin_time.T
 
     rescale_fact = np.abs(wave_amp) / np.max(np.abs(wave_amp_time))
 
     # Rescale the wave spectral amplitude coefficients and assign phase
     mler_norm = xr.Dataset(
         {
-            "WaveSpectrum": (
-                ["frequency"],
-                mler_xr["WaveSpectrum"].data * rescale_fact**2,
-            ),
-            "Phase": (["frequency"], mler_xr["Phase"].data),
+            "WaveSpectrum": (["frequency"], wave_spectrum * rescale_fact**2),
+            "Phase": (["frequency"], phase),
+        },
+        coords={
+            "frequency": (["frequency"], mler_xr.coords[frequency_dimension].values)
         },
-        coords={"frequency": (["frequency"], mler_xr.coords[freq_dim].data)},
     )
     return mler_norm.to_pandas() if to_pandas else mler_norm
 
@@ -418,7 +465,6 @@ def mler_export_time_series(
         )
 
     rao = np.array(rao, dtype=float) if not isinstance(rao, np.ndarray) else rao
-    k = np.array(k, dtype=float) if not isinstance(k, np.ndarray) else k
     # If input is pandas, convert to xarray
     mler = mler if isinstance(mler, xr.Dataset) else mler.to_xarray()
 
@@ -427,23 +473,20 @@ def mler_export_time_series(
         frequency_dimension if frequency_dimension else list(mler.coords)[0]
     )
     freq = mler.coords[frequency_dimension].values * 2 * np.pi
-    d_w = np.diff(freq).mean()
-
-    wave_height = np.zeros(len(sim["T"]))
-    linear_response = np.zeros(len(sim["T"]))
-    for i, t_i in enumerate(sim["T"]):
-        cos_terms = np.cos(
-            freq * (t_i - sim["T0"])
-            - k * (sim["X0"] - sim["X0"])
-            + mler["Phase"].values
-        )
-        wave_height[i] = np.sum(np.sqrt(2 * mler["WaveSpectrum"] * d_w) * cos_terms)
 
-        linear_response[i] = np.sum(
-            np.sqrt(2 * mler["WaveSpectrum"] * d_w)
-            * np.abs(rao)
-            * np.cos(freq * (t_i - sim["T0"]) - k * (sim["X0"] - sim["X0"]))
-        )
+    # Read the coefficients out of the dataset once
+    amplitude = np.sqrt(2 * mler["WaveSpectrum"].values * np.diff(freq).mean())
+    phase = mler["Phase"].values
+
+    # At X0 the wave number term vanishes, so each output is a
+    # (maxIT, nfreq) x (nfreq,) product. The phase is applied through
+    # cos(a + b) = cos(a)cos(b) - sin(a)sin(b) so both outputs share the
+    # same cosine matrix.
+    cos_time, sin_time = _cos_sin_phase(sim["T"] - sim["T0"], freq)
+    wave_height = cos_time @ (amplitude * np.cos(phase)) - sin_time @ (
+        amplitude * np.sin(phase)
+    )
+    linear_response = cos_time @ (amplitude * np.abs(rao))
 
     # Construct the output dataset
     mler_ts = xr.Dataset(
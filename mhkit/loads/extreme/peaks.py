@@ -9,6 +9,10 @@ Functions:
 - _peaks_over_threshold: Identifies peaks over a specified 
   threshold and returns independent storm peak values adjusted by
   the threshold.
+- _storm_peaks_over_threshold: Same as _peaks_over_threshold for a
+  precomputed independence window.
+- _independent_storm_peaks: Filters storm peaks so that retained peaks
+  are independent, i.e. separated by more than the window size.
 - global_peaks: Identifies global peaks in a zero-centered 
   response time-series based on consecutive zero up-crossings.
 - number_of_short_term_peaks: Estimates the number of peaks within a
@@ -19,6 +23,14 @@ Functions:
  using the Weibull tail fit method.
 - automatic_hs_threshold: Determines the best significant wave height
  threshold for the peaks-over-threshold method.
+- _uniform_order_statistic_medians: Plotting positions used for the
+ probability plot correlation in automatic_hs_threshold.
+- _genpareto_pwm: Closed-form probability weighted moments estimate
+ of the generalized Pareto distribution parameters.
+- _threshold_correlation: Probability plot correlation of the
+ generalized Pareto fit at a single threshold.
+- _threshold_correlations: Memoized, optionally parallel, correlations
+ of a range of thresholds.
 - peaks_distribution_peaks_over_threshold: Estimates the peaks
  distribution using the peaks over threshold method by fitting a 
  generalized Pareto distribution.
@@ -35,10 +47,13 @@ from typing import List, Tuple, Optional
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy import stats, optimize, signal
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy import stats, optimize, special
+from scipy import fft as sp_fft
 from scipy.stats import rv_continuous
 
 from mhkit.utils import upcrossing
+from mhkit.utils.numba_utils import njit
 
 
 def _calculate_window_size(peaks: NDArray[np.float64], sampling_rate: float) -> float:
@@ -57,13 +72,16 @@ def _calculate_window_size(peaks: NDArray[np.float64], sampling_rate: float) ->
     float
         The window size determined by the auto-correlation function.
     """
-    n_lags = int(14 * 24 / sampling_rate)
+    n_lags = min(int(14 * 24 / sampling_rate), len(peaks) - 1)
     deviations_from_mean = peaks - np.mean(peaks)
-    acf = signal.correlate(deviations_from_mean, deviations_from_mean, mode="full")
-    lag = signal.correlation_lags(len(peaks), len(peaks), mode="full")
-    idx_zero = np.argmax(lag == 0)
-    positive_lag = lag[idx_zero : idx_zero + n_lags + 1]
-    acf_positive = acf[idx_zero : idx_zero + n_lags + 1] / acf[idx_zero]
+    # Only the non-negative lags up to n_lags are needed, so compute the
+    # auto-correlation through a zero-padded FFT rather than the full
+    # two-sided correlation.
+    n_fft = sp_fft.next_fast_len(2 * len(peaks) - 1, real=True)
+    spectrum = sp_fft.rfft(deviations_from_mean, n_fft)
+    acf = sp_fft.irfft(spectrum * np.conj(spectrum), n_fft)[: n_lags + 1]
+    positive_lag = np.arange(n_lags + 1)
+    acf_positive = acf / acf[0]
 
     window_size = sampling_rate * positive_lag[acf_positive < 0.5][0]
     return window_size / sampling_rate
@@ -99,27 +117,139 @@ def _peaks_over_threshold(
     -----
     This function requires the global_peaks function to identify the
     maxima between consecutive zero up-crossings and uses the signal processing
-    capabilities from scipy.signal for calculating the auto-correlation function.
+    capabilities from scipy.fft for calculating the auto-correlation function.
+    """
+    window = _calculate_window_size(peaks, sampling_rate)
+    return _storm_peaks_over_threshold(peaks, threshold, window)
+
+
+def _storm_peaks_over_threshold(
+    peaks: NDArray[np.float64], threshold: float, window: float
+) -> List[float]:
+    """
+    Identifies independent storm peaks over a specified threshold for a
+    precomputed independence window. The window only depends on `peaks`,
+    so callers evaluating several thresholds can compute it once with
+    `_calculate_window_size`.
+
+    Parameters
+    ----------
+    peaks : np.ndarray
+        A NumPy array of peak values from a time series.
+    threshold : float
+        The percentile threshold (0-1) to identify significant peaks.
+    window : float
+        Minimum separation between independent peaks.
+
+    Returns
+    -------
+    List[float]
+        A list of independent peak values exceeding the specified
+        threshold, adjusted by the threshold. Empty if the peaks never
+        cross the threshold.
     """
     threshold_unit = np.percentile(peaks, 100 * threshold, method="hazen")
     idx_peaks = np.arange(len(peaks))
-    idx_storm_peaks, storm_peaks = global_peaks(idx_peaks, peaks - threshold_unit)
-    idx_storm_peaks = idx_storm_peaks.astype(int)
+    idx_storm_peaks, _ = global_peaks(idx_peaks, peaks - threshold_unit)
+    idx_storm_peaks = idx_storm_peaks.astype(np.int64)
+    # The compiled kernel does not bounds check, so handle no storm peaks here
+    if idx_storm_peaks.size == 0:
+        return []
+
+    _, independent_storm_peaks = _independent_storm_peaks(
+        idx_storm_peaks, peaks.astype(np.float64), threshold_unit, window
+    )
 
-    independent_storm_peaks = [storm_peaks[0]]
-    idx_independent_storm_peaks = [idx_storm_peaks[0]]
+    return list(independent_storm_peaks)
 
-    window = _calculate_window_size(peaks, sampling_rate)
 
-    for idx in idx_storm_peaks[1:]:
-        if (idx - idx_independent_storm_peaks[-1]) > window:
-            idx_independent_storm_peaks.append(idx)
-            independent_storm_peaks.append(peaks[idx] - threshold_unit)
-        elif peaks[idx] > independent_storm_peaks[-1]:
-            idx_independent_storm_peaks[-1] = idx
-            independent_storm_peaks[-1] = peaks[idx] - threshold_unit
+@njit(cache=True)
+def _independent_storm_peaks(
+    idx_storm_peaks: NDArray[np.int64],
+    peaks: NDArray[np.float64],
+    threshold_unit: float,
+    window: float,
+) -> Tuple[NDArray[np.int64], NDArray[np.float64]]:
+    """
+    Filter storm peaks so that consecutive peaks are separated by more
+    than `window` samples, keeping the largest peak within each window.
+
+    Parameters
+    ----------
+    idx_storm_peaks : np.ndarray
+        Indices of the storm peaks in `peaks`.
+    peaks : np.ndarray
+        A NumPy array of peak values from a time series.
+    threshold_unit : float
+        Threshold value subtracted from the retained peaks.
+    window : float
+        Minimum separation between independent peaks.
 
-    return independent_storm_peaks
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Indices and threshold-adjusted values of the independent storm
+        peaks.
+    """
+    n_storm_peaks = len(idx_storm_peaks)
+    idx_independent = np.empty(n_storm_peaks, np.int64)
+    independent = np.empty(n_storm_peaks, np.float64)
+
+    idx_independent[0] = idx_storm_peaks[0]
+    independent[0] = peaks[idx_storm_peaks[0]] - threshold_unit
+    count = 1
+    for i in range(1, n_storm_peaks):
+        idx = idx_storm_peaks[i]
+        if (idx - idx_independent[count - 1]) > window:
+            idx_independent[count] = idx
+            independent[count] = peaks[idx] - threshold_unit
+            count += 1
+        elif peaks[idx] > independent[count - 1]:
+            idx_independent[count - 1] = idx
+            independent[count - 1] = peaks[idx] - threshold_unit
+
+    return idx_independent[:count], independent[:count]
+
+
+def _segment_argmax(data: np.ndarray, starts: np.ndarray, end: int) -> np.ndarray:
+    """
+    Index of the first maximum of `data` in each segment
+    `[starts[i], starts[i + 1])`, with the last segment ending at `end`
+    (exclusive).
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Response time-series.
+    starts : np.ndarray
+        Increasing start indices of the segments.
+    end : int
+        Exclusive end index of the last segment.
+
+    Returns
+    -------
+    np.ndarray
+        Indices of the segment maxima in `data`, matching `np.argmax`
+        applied to each segment.
+    """
+    if starts.size == 0:
+        return np.empty(0, dtype=int)
+
+    segments = data[starts[0] : end]
+    relative_starts = starts - starts[0]
+    segment_max = np.maximum.reduceat(segments, relative_starts)
+    segment_id = np.repeat(
+        np.arange(starts.size), np.diff(np.append(relative_starts, segments.size))
+    )
+    # Candidates equal to their segment maximum (NaN propagates to the
+    # maximum, and argmax returns the first NaN, so NaNs count as maxima).
+    candidates = np.flatnonzero(
+        (segments == segment_max[segment_id]) | np.isnan(segments)
+    )
+    candidate_segment = segment_id[candidates]
+    first = np.ones(candidates.size, dtype=bool)
+    first[1:] = candidate_segment[1:] != candidate_segment[:-1]
+    return candidates[first] + starts[0]
 
 
 def global_peaks(time: np.ndarray, data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -151,22 +281,11 @@ def global_peaks(time: np.ndarray, data: np.ndarray) -> Tuple[np.ndarray, np.nda
     # Find zero up-crossings
     inds = upcrossing(time, data)
 
-    # We also include the final point in the dataset
-    inds = np.append(inds, len(data) - 1)
-
     # As we want to return both the time and peak
-    # values, look for the index at the peak.
-    # The call to argmax gives us the index within the
-    # upcrossing period. Therefore to get the index in the
-    # original array we need to add on the index that
-    # starts the zero crossing period, ind1.
-    def find_peak_index(ind1, ind2):
-        return np.argmax(data[ind1:ind2]) + ind1
-
-    peak_inds = np.array(
-        [find_peak_index(ind1, inds[i + 1]) for i, ind1 in enumerate(inds[:-1])],
-        dtype=int,
-    )
+    # values, look for the index at the peak of each
+    # upcrossing period. The final period ends at the
+    # last point in the dataset.
+    peak_inds = _segment_argmax(data, inds, len(data) - 1)
 
     return time[peak_inds], data[peak_inds]
 
@@ -232,6 +351,61 @@ def peaks_distribution_weibull(peaks_data: NDArray[np.float_]) -> rv_continuous:
     return peaks
 
 
+def _weibull_cdf(
+    data_points: NDArray[np.float_], shape: float, scale: float
+) -> NDArray[np.float_]:
+    """
+    Closed-form CDF of the two-parameter Weibull distribution, equivalent
+    to `stats.exponweib(a=1, c=shape, loc=0, scale=scale).cdf`.
+
+    Parameters
+    ----------
+    data_points : np.ndarray
+        Points at which to evaluate the CDF.
+    shape : float
+        Weibull shape parameter.
+    scale : float
+        Weibull scale parameter.
+
+    Returns
+    -------
+    np.ndarray
+        CDF evaluated at `data_points`.
+    """
+    normalized = (np.maximum(data_points, 0.0) / scale) ** shape
+    return -np.expm1(-normalized)
+
+
+def _weibull_cdf_jacobian(
+    data_points: NDArray[np.float_], shape: float, scale: float
+) -> NDArray[np.float_]:
+    """
+    Jacobian of `_weibull_cdf` with respect to the shape and scale
+    parameters.
+
+    Parameters
+    ----------
+    data_points : np.ndarray
+        Points at which to evaluate the Jacobian.
+    shape : float
+        Weibull shape parameter.
+    scale : float
+        Weibull scale parameter.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (len(data_points), 2) with the derivatives with
+        respect to shape and scale.
+    """
+    ratio = np.maximum(data_points, 0.0) / scale
+    normalized = ratio**shape
+    survival = np.exp(-normalized)
+    d_shape = survival * special.xlogy(normalized, ratio)  # pylint: disable=no-member
+    d_scale = -survival * normalized * shape / scale
+    return np.column_stack([d_shape, d_scale])
+
+
 # pylint: disable=R0914
 def peaks_distribution_weibull_tail_fit(
     peaks_data: NDArray[np.float_],
@@ -264,23 +438,27 @@ def peaks_distribution_weibull_tail_fit(
     # Approximate CDF
     peaks_data = np.sort(peaks_data)
     n_peaks = len(peaks_data)
-    cdf_positions = np.zeros(n_peaks)
-    for i in range(n_peaks):
-        cdf_positions[i] = i / (n_peaks + 1.0)
+    cdf_positions = np.arange(n_peaks) / (n_peaks + 1.0)
     # Divide into seven sets & fit Weibull
     subset_shape_params = np.zeros(7)
     subset_scale_params = np.zeros(7)
     set_lim = np.arange(0.60, 0.90, 0.05)
-
-    def weibull_cdf(data_points, shape, scale):
-        return stats.exponweib(a=1, c=shape, loc=0, scale=scale).cdf(data_points)
+    # cdf_positions is sorted, so each set is a tail slice
+    set_start = np.searchsorted(cdf_positions, set_lim, side="right")
 
     for local_set in range(7):
-        global_peaks_set = peaks_data[(cdf_positions > set_lim[local_set])]
-        cdf_positions_set = cdf_positions[(cdf_positions > set_lim[local_set])]
+        global_peaks_set = peaks_data[set_start[local_set] :]
+        cdf_positions_set = cdf_positions[set_start[local_set] :]
         # pylint: disable=W0632
         p_opt, _ = optimize.curve_fit(
-            weibull_cdf, global_peaks_set, cdf_positions_set, p0=p_0
+            _weibull_cdf,
+            global_peaks_set,
+            cdf_positions_set,
+            p0=p_0,
+            jac=_weibull_cdf_jacobian,
+            check_finite=False,
+            ftol=1e-6,
+            xtol=1e-6,
         )
         subset_shape_params[local_set] = p_opt[0]
         subset_scale_params[local_set] = p_opt[1]
@@ -296,12 +474,198 @@ def peaks_distribution_weibull_tail_fit(
     return peaks
 
 
-# pylint: disable=R0914
+def _uniform_order_statistic_medians(n_data: int) -> NDArray[np.float_]:
+    """
+    Approximate medians of the order statistics of the uniform
+    distribution (Filliben's estimate), matching the plotting positions
+    used by `scipy.stats.probplot`.
+
+    Parameters
+    ----------
+    n_data : int
+        Number of data points.
+
+    Returns
+    -------
+    np.ndarray
+        Order statistic medians.
+    """
+    medians = np.empty(n_data)
+    medians[-1] = 0.5 ** (1.0 / n_data)
+    medians[0] = 1 - medians[-1]
+    i = np.arange(2, n_data)
+    medians[1:-1] = (i - 0.3175) / (n_data + 0.365)
+    return medians
+
+
+def _genpareto_pwm(data: NDArray[np.float_]) -> Tuple[float, float, float]:
+    """
+    Estimate the parameters of a generalized Pareto distribution with
+    location fixed at zero using probability weighted moments.
+
+    Hosking, J. R. M. and J. R. Wallis (1987). "Parameter and Quantile
+    Estimation for the Generalized Pareto Distribution." Technometrics,
+    29(3), 339-349.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Exceedances over the threshold.
+
+    Returns
+    -------
+    Tuple[float, float, float]
+        Shape, location and scale parameters in the convention of
+        `scipy.stats.genpareto`.
+    """
+    data = np.sort(np.asarray(data, dtype=float))
+    n_data = len(data)
+    moment_0 = np.mean(data)
+    moment_1 = np.mean((n_data - 1 - np.arange(n_data)) / (n_data - 1) * data)
+    denominator = moment_0 - 2 * moment_1
+    # Hosking's shape k has the opposite sign of scipy's c
+    shape = 2 - moment_0 / denominator
+    scale = 2 * moment_0 * moment_1 / denominator
+    return shape, 0.0, scale
+
+
+def _threshold_correlation(
+    threshold: float,
+    correlation_inputs: Tuple[
+        NDArray[np.float_], float, float, NDArray[np.float_], NDArray[np.float_]
+    ],
+    *,
+    fit_method: str = "mle",
+) -> Optional[float]:
+    """
+    Fit a generalized Pareto distribution to the independent storm peaks
+    over a threshold and return its probability plot correlation
+    coefficient against all peaks.
+
+    Parameters
+    ----------
+    threshold : float
+        The percentile threshold (0-1).
+    correlation_inputs : Tuple
+        Inputs that do not depend on the threshold, as
+        (peaks, window, years, sorted_peaks, order_statistic_medians):
+        the peak values of the response time-series, the minimum
+        separation between independent peaks, the length of the record in
+        years, `peaks` sorted in ascending order and the plotting
+        positions from `_uniform_order_statistic_medians`.
+    fit_method : str
+        'mle' or 'pwm', see `automatic_hs_threshold`.
+
+    Returns
+    -------
+    Optional[float]
+        The correlation coefficient, or None if there are fewer than two
+        independent peaks over the threshold in total or per year.
+    """
+    peaks, window, years, sorted_peaks, order_statistic_medians = correlation_inputs
+    distribution = stats.genpareto
+    over_threshold = _storm_peaks_over_threshold(peaks, threshold, window)
+    # Fewer than two exceedances cannot be fit (the PWM estimates divide by
+    # n - 1), whatever the record length
+    rate_per_year = len(over_threshold) / years
+    if len(over_threshold) < 2 or rate_per_year < 2:
+        return None
+    if fit_method == "pwm":
+        distributions_parameters = _genpareto_pwm(over_threshold)
+    else:
+        distributions_parameters = distribution.fit(over_threshold, floc=0.0)
+    # Probability plot correlation coefficient, as returned by
+    # stats.probplot(..., fit=True)
+    theoretical_quantiles = distribution.ppf(
+        order_statistic_medians, *distributions_parameters
+    )
+    return np.corrcoef(theoretical_quantiles, sorted_peaks)[0, 1]
+
+
+def _threshold_correlations(
+    thresholds: NDArray[np.float_],
+    correlation_cache: dict,
+    correlation_inputs: Tuple,
+    *,
+    fit_method: str,
+    n_jobs: int,
+) -> List[float]:
+    """
+    Return the correlation of each threshold in turn, stopping before the
+    first threshold with too few peaks. Correlations are memoized in
+    `correlation_cache`, keyed by the threshold rounded to 7 decimals,
+    with None marking a threshold with too few peaks.
+
+    Parameters
+    ----------
+    thresholds : np.ndarray
+        Percentile thresholds (0-1) in ascending order.
+    correlation_cache : dict
+        Correlations of previously evaluated thresholds, updated in place.
+    correlation_inputs : Tuple
+        Threshold independent inputs, see `_threshold_correlation`.
+    fit_method : str
+        'mle' or 'pwm', see `automatic_hs_threshold`.
+    n_jobs : int
+        Number of parallel jobs, see `automatic_hs_threshold`.
+
+    Returns
+    -------
+    List[float]
+        Correlation coefficients of the leading thresholds with enough
+        peaks.
+    """
+    if n_jobs != 1:
+        # Evaluate the thresholds not seen in earlier passes in parallel, one
+        # batch per worker at a time and in ascending order, so that no fits
+        # are started past the first threshold with too few peaks
+        new_thresholds = []
+        for threshold in thresholds:
+            key = round(threshold, 7)
+            if key not in correlation_cache:
+                new_thresholds.append(threshold)
+            elif correlation_cache[key] is None:
+                break
+        batch_size = effective_n_jobs(n_jobs)
+        with Parallel(n_jobs=n_jobs) as parallel:
+            for start in range(0, len(new_thresholds), batch_size):
+                batch = new_thresholds[start : start + batch_size]
+                batch_correlations = parallel(
+                    delayed(_threshold_correlation)(
+                        threshold, correlation_inputs, fit_method=fit_method
+                    )
+                    for threshold in batch
+                )
+                correlation_cache.update(
+                    zip(
+                        (round(threshold, 7) for threshold in batch), batch_correlations
+                    )
+                )
+                if any(correlation is None for correlation in batch_correlations):
+                    break
+
+    correlations = []
+    for threshold in thresholds:
+        key = round(threshold, 7)
+        if key not in correlation_cache:
+            correlation_cache[key] = _threshold_correlation(
+                threshold, correlation_inputs, fit_method=fit_method
+            )
+        if correlation_cache[key] is None:
+            break
+        correlations.append(correlation_cache[key])
+    return correlations
+
+
+# pylint: disable=R0913,R0914
 def automatic_hs_threshold(
     peaks: NDArray[np.float_],
     sampling_rate: float,
     initial_threshold_range: Tuple[float, float, float] = (0.990, 0.995, 0.001),
     max_refinement: int = 5,
+    *,
+    fit_method: str = "mle",
+    n_jobs: int = 1,
 ) -> Tuple[float, float]:
     """
     Find the best significant wave height threshold for the
@@ -333,6 +697,16 @@ def automatic_hs_threshold(
         (min, max, step).
     max_refinement: int
         Maximum number of times to refine the search range.
+    fit_method: str (optional)
+        Method used to fit the generalized Pareto distribution at each
+        threshold. 'mle' (default) uses maximum likelihood estimation as
+        in the reference above. 'pwm' uses the closed-form probability
+        weighted moments estimator, which is much faster but may select
+        a slightly different threshold.
+    n_jobs: int (optional)
+        Number of parallel jobs used to evaluate the thresholds of each
+        search range with joblib. Default = 1 (serial), -1 uses all
+        processors.
 
     Returns
     -------
@@ -354,26 +728,36 @@ def automatic_hs_threshold(
         raise TypeError(
             f"max_refinement must be of type int. Got: {type(max_refinement)}"
         )
+    if fit_method not in ("mle", "pwm"):
+        raise ValueError(f"fit_method must be 'mle' or 'pwm'. Got: {fit_method}")
+    if not isinstance(n_jobs, int):
+        raise TypeError(f"n_jobs must be of type int. Got: {type(n_jobs)}")
 
     range_min, range_max, range_step = initial_threshold_range
     best_threshold = -1
     years = len(peaks) / (365.25 * 24 / sampling_rate)
 
+    # The independence window does not depend on the threshold, and
+    # refined ranges revisit thresholds from earlier passes, so compute
+    # the window once and memoize the correlation of each threshold.
+    # A cached value of None marks a threshold with too few peaks.
+    window = _calculate_window_size(peaks, sampling_rate)
+    correlation_cache = {}
+
+    # Probability plot inputs that do not depend on the threshold
+    sorted_peaks = np.sort(peaks)
+    order_statistic_medians = _uniform_order_statistic_medians(len(peaks))
+    correlation_inputs = (peaks, window, years, sorted_peaks, order_statistic_medians)
+
     for i in range(max_refinement):
         thresholds = np.arange(range_min, range_max, range_step)
-        correlations = []
-
-        for threshold in thresholds:
-            distribution = stats.genpareto
-            over_threshold = _peaks_over_threshold(peaks, threshold, sampling_rate)
-            rate_per_year = len(over_threshold) / years
-            if rate_per_year < 2:
-                break
-            distributions_parameters = distribution.fit(over_threshold, floc=0.0)
-            _, (_, _, correlation) = stats.probplot(
-                peaks, distributions_parameters, distribution, fit=True
-            )
-            correlations.append(correlation)
+        correlations = _threshold_correlations(
+            thresholds,
+            correlation_cache,
+            correlation_inputs,
+            fit_method=fit_method,
+            n_jobs=n_jobs,
+        )
 
         max_i = np.argmax(correlations)
         minimal_change = np.abs(best_threshold - thresholds[max_i]) < 0.0005
@@ -434,11 +818,10 @@ def peaks_distribution_peaks_over_threshold(
             f"If specified, threshold must be of type float. Got: {type(threshold)}"
         )
 
-    # peaks over threshold
-    peaks_data = np.sort(peaks_data)
+    # peaks over threshold (the fit does not require sorted data)
     pot = peaks_data[peaks_data > threshold] - threshold
-    npeaks = len(peaks_data)
-    npot = len(pot)
+    npeaks = peaks_data.size
+    npot = pot.size
     # Fit a generalized Pareto
     pot_params = stats.genpareto.fit(pot, floc=0.0)
     param_names = ["c", "loc", "scale"]
@@ -450,32 +833,61 @@ def peaks_distribution_peaks_over_threshold(
     # peaks
     class _Peaks(rv_continuous):
         def __init__(
-            self, pot_distribution: rv_continuous, threshold: float, *args, **kwargs
+            self,
+            pot_distribution: rv_continuous,
+            threshold: float,
+            prop_pot: float,
+            *args,
+            **kwargs,
         ):
             self.pot = pot_distribution
             self.threshold = threshold
+            # Proportion of the peaks that are above the threshold
+            self.prop_pot = prop_pot
             super().__init__(*args, **kwargs)
 
         # pylint: disable=arguments-differ
         def _cdf(self, data_points, *args, **kwds) -> NDArray[np.float_]:
             # Convert data_points to a NumPy array if it's not already
             data_points = np.atleast_1d(data_points)
-            out = np.zeros_like(data_points)
 
-            # Use the instance's threshold attribute instead of passing as a parameter
-            below_threshold = data_points < self.threshold
-            out[below_threshold] = np.NaN
+            # The distribution is undefined (NaN) below the threshold
+            above_threshold = data_points >= self.threshold
+            pot_ccdf = 1.0 - self.pot.cdf(
+                np.where(above_threshold, data_points - self.threshold, 0.0),
+                *args,
+                **kwds,
+            )
+            return np.where(above_threshold, 1.0 - self.prop_pot * pot_ccdf, np.nan)
+
+        # pylint: disable=arguments-differ
+        def _pdf(self, data_points, *args, **kwds) -> NDArray[np.float_]:
+            data_points = np.atleast_1d(data_points)
+            above_threshold = data_points >= self.threshold
+            pot_pdf = self.pot.pdf(
+                np.where(above_threshold, data_points - self.threshold, 0.0),
+                *args,
+                **kwds,
+            )
+            return np.where(above_threshold, self.prop_pot * pot_pdf, np.nan)
 
-            above_threshold_indices = ~below_threshold
-            if np.any(above_threshold_indices):
-                points_above_threshold = data_points[above_threshold_indices]
-                pot_ccdf = 1.0 - self.pot.cdf(
-                    points_above_threshold - self.threshold, *args, **kwds
-                )
-                prop_pot = npot / npeaks
-                out[above_threshold_indices] = 1.0 - (prop_pot * pot_ccdf)
-            return out
+        # pylint: disable=arguments-differ
+        def _ppf(self, quantiles, *args, **kwds) -> NDArray[np.float_]:
+            # Invert _cdf directly instead of numerically root finding.
+            # Quantiles below the threshold are undefined (NaN).
+            quantiles = np.atleast_1d(quantiles)
+            pot_ccdf = (1.0 - quantiles) / self.prop_pot
+            defined = pot_ccdf <= 1.0
+            pot_quantiles = self.pot.ppf(
+                np.where(defined, 1.0 - pot_ccdf, 0.0), *args, **kwds
+            )
+            return np.where(defined, self.threshold + pot_quantiles, np.nan)
 
-    peaks = _Peaks(name="peaks", pot_distribution=pot, threshold=threshold)
+    peaks = _Peaks(
+        name="peaks",
+        pot_distribution=pot,
+        threshold=threshold,
+        prop_pot=npot / npeaks,
+    )
     peaks.pot = pot
     return peaks
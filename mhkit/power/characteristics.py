@@ -19,18 +19,191 @@ Functions:
     (line-to-neutral or line-to-line).
 """
 
-from typing import Union
+from typing import Tuple, Union
 import pandas as pd
 import xarray as xr
 import numpy as np
-from scipy.signal import hilbert
+from scipy import fft as sp_fft
 from mhkit.utils import convert_to_dataset
+from mhkit.utils.numba_utils import HAS_NUMBA, njit, prange
+
+try:
+    from pyfftw.interfaces import cache as fftw_cache
+    from pyfftw.interfaces import scipy_fft as _fft
+
+    # Keep FFTW plans alive between calls on same-length signals
+    fftw_cache.enable()
+    fftw_cache.set_keepalive_time(60)
+except ImportError:
+    # pyfftw is optional; scipy.fft computes the same transforms
+    _fft = sp_fft
+
+
+def _analytic_signal(signals: np.ndarray) -> np.ndarray:
+    """
+    Computes the analytic signal of real signals along the last axis.
+
+    Equivalent to `scipy.signal.hilbert`, but takes the forward transform
+    with a real FFT, which only computes the non-negative frequencies
+    that the analytic signal keeps. Uses FFTW with cached plans when
+    pyfftw is installed, and scipy.fft otherwise.
+
+    Parameters
+    -----------
+    signals: numpy array
+        Real signals with time along the last axis
+
+    Returns
+    ---------
+    analytic: numpy array
+        Complex analytic signals, same shape as signals
+    """
+    n_samples = signals.shape[-1]
+    spectrum = _fft.rfft(signals, axis=-1)
+
+    # Double the positive frequencies, keep DC (and Nyquist for even lengths)
+    weights = np.full(spectrum.shape[-1], 2.0)
+    weights[0] = 1.0
+    if n_samples % 2 == 0:
+        weights[-1] = 1.0
+
+    # Negative frequencies of the analytic signal are zero
+    analytic_spectrum = np.zeros(
+        signals.shape[:-1] + (n_samples,), dtype=spectrum.dtype
+    )
+    analytic_spectrum[..., : spectrum.shape[-1]] = spectrum * weights
+    return _fft.ifft(analytic_spectrum, axis=-1)
+
+
+@njit(parallel=True, cache=True)
+def _unwrap_diff_scale(phase, scale, out):
+    """
+    Fused equivalent of `np.diff(np.unwrap(phase)) * scale` along the
+    last axis, compiled with numba.
+
+    The difference of consecutive unwrapped phases is the wrapped phase
+    difference whenever the jump reaches pi, so no running 2 pi
+    correction needs to be carried between samples.
+
+    Parameters
+    -----------
+    phase: numpy array
+        Wrapped phase [rad] as [signal, time]
+
+    scale: numpy array
+        Factor applied to each phase difference, one per time step
+
+    out: numpy array
+        Output array as [signal, time - 1], filled in place
+
+    Returns
+    ---------
+    out: numpy array
+        Scaled unwrapped phase differences
+    """
+    for row in prange(phase.shape[0]):  # pylint: disable=not-an-iterable
+        for j in range(phase.shape[1] - 1):
+            d_phase = phase[row, j + 1] - phase[row, j]
+            if abs(d_phase) >= np.pi:
+                wrapped = (d_phase + np.pi) % (2.0 * np.pi) - np.pi
+                if wrapped == -np.pi and d_phase > 0:
+                    wrapped = np.pi
+                d_phase = wrapped
+            out[row, j] = d_phase * scale[j]
+    return out
+
+
+def _unwrapped_phase_rate(phase: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """
+    Calculates the scaled difference of unwrapped phase along the last
+    axis.
+
+    Parameters
+    -----------
+    phase: numpy array
+        Wrapped phase [rad] with time along the last axis
+
+    scale: numpy array
+        Factor applied to each phase difference, 1 / (2 pi d_t) to convert
+        radians per time step to Hz
+
+    Returns
+    ---------
+    rate: numpy array
+        Scaled phase rate, one sample shorter than phase along the last axis
+    """
+    if HAS_NUMBA:
+        out = np.empty(phase.shape[:-1] + (phase.shape[-1] - 1,))
+        return _unwrap_diff_scale(phase, scale, out)
+    instantaneous_phase = np.unwrap(phase, axis=-1)
+    return np.diff(instantaneous_phase, axis=-1) * scale
+
+
+def _instantaneous_frequency_torch(
+    signals: np.ndarray, scale: np.ndarray
+) -> np.ndarray:
+    """
+    Calculates the instantaneous frequency of real signals along the last
+    axis with PyTorch (>= 1.8, for torch.fft and torch.diff), on the GPU
+    when CUDA is available. The analytic signal, phase and phase rate are
+    computed in single precision.
+
+    Parameters
+    -----------
+    signals: numpy array
+        Real signals with time along the last axis
+
+    scale: numpy array
+        Factor converting each phase difference to Hz, 1 / (2 pi d_t)
+
+    Returns
+    ---------
+    frequency: numpy array
+        Instantaneous frequency [Hz], one sample shorter than signals along
+        the last axis
+    """
+    try:
+        import torch  # pylint: disable=import-outside-toplevel
+    except ImportError as err:
+        raise ImportError(
+            "backend='torch' requires PyTorch >= 1.8. Install torch or use "
+            + "backend='numpy'"
+        ) from err
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    signals = torch.as_tensor(signals, dtype=torch.float32, device=device)
+    n_samples = signals.shape[-1]
+
+    # Analytic signal, see _analytic_signal
+    spectrum = torch.fft.rfft(signals, dim=-1)
+    weights = torch.full((spectrum.shape[-1],), 2.0, device=device)
+    weights[0] = 1.0
+    if n_samples % 2 == 0:
+        weights[-1] = 1.0
+    analytic_spectrum = torch.zeros(
+        signals.shape[:-1] + (n_samples,), dtype=spectrum.dtype, device=device
+    )
+    analytic_spectrum[..., : spectrum.shape[-1]] = spectrum * weights
+    phase = torch.angle(torch.fft.ifft(analytic_spectrum, dim=-1))
+
+    # Difference of the unwrapped phase, see _unwrap_diff_scale
+    d_phase = torch.diff(phase, dim=-1)
+    wrapped = torch.remainder(d_phase + np.pi, 2.0 * np.pi) - np.pi
+    wrapped = torch.where(
+        (wrapped == -np.pi) & (d_phase > 0), torch.full_like(wrapped, np.pi), wrapped
+    )
+    d_phase = torch.where(d_phase.abs() >= np.pi, wrapped, d_phase)
+
+    scale = torch.as_tensor(scale, dtype=torch.float32, device=device)
+    frequency = d_phase * scale
+    return frequency.cpu().numpy()
 
 
 def instantaneous_frequency(
     measured_voltage: Union[pd.Series, pd.DataFrame, xr.DataArray, xr.Dataset],
     time_dimension: str = "",
     to_pandas: bool = True,
+    backend: str = "numpy",
 ) -> Union[pd.DataFrame, xr.Dataset]:
     """
     Calculates instantaneous frequency of measured voltage
@@ -47,6 +220,11 @@ def instantaneous_frequency(
     to_pandas: bool (Optional)
         Flag to save output to pandas instead of xarray. Default = True.
 
+    backend: string (Optional)
+        Array library used for the calculation, "numpy" or "torch".
+        "torch" requires PyTorch >= 1.8, runs on the GPU when CUDA is available
+        and computes in single precision. Default = "numpy".
+
     Returns
     ---------
     frequency: pandas DataFrame or xarray Dataset
@@ -66,6 +244,8 @@ def instantaneous_frequency(
         raise TypeError(
             f"time_dimension must be of type bool. Got: {type(time_dimension)}"
         )
+    if backend not in ("numpy", "torch"):
+        raise ValueError(f"backend must be 'numpy' or 'torch'. Got: {backend}")
 
     # Convert input to xr.Dataset
     measured_voltage = convert_to_dataset(measured_voltage, "data")
@@ -81,25 +261,27 @@ def instantaneous_frequency(
         time_dimension = list(measured_voltage.coords)[0]
 
     # Calculate time step
-    if isinstance(measured_voltage.coords[time_dimension].values[0], np.datetime64):
-        time = (
-            measured_voltage[time_dimension] - np.datetime64("1970-01-01 00:00:00")
-        ) / np.timedelta64(1, "s")
+    time = measured_voltage.coords[time_dimension].values
+    if np.issubdtype(time.dtype, np.datetime64):
+        d_t = np.diff(time) / np.timedelta64(1, "s")
     else:
-        time = measured_voltage[time_dimension]
-    d_t = np.diff(time)
-
-    # Calculate frequency
-    frequency = xr.Dataset()
-    for var in measured_voltage.data_vars:
-        freq = hilbert(measured_voltage[var])
-        instantaneous_phase = np.unwrap(np.angle(freq))
-        f_instantaneous = np.diff(instantaneous_phase) / (2.0 * np.pi) * (1 / d_t)
-
-        frequency = frequency.assign({var: (time_dimension, f_instantaneous)})
-        frequency = frequency.assign_coords(
-            {time_dimension: measured_voltage.coords[time_dimension].values[0:-1]}
-        )
+        d_t = np.diff(time)
+    # Converts phase difference per time step [rad] to frequency [Hz]
+    scale = 1.0 / (2.0 * np.pi) / d_t
+
+    # Calculate frequency of all signals at once, one signal per row
+    variables = list(measured_voltage.data_vars)
+    signals = np.stack([measured_voltage[var].values for var in variables])
+    if backend == "torch":
+        f_instantaneous = _instantaneous_frequency_torch(signals, scale)
+    else:
+        analytic_signal = _analytic_signal(signals)
+        f_instantaneous = _unwrapped_phase_rate(np.angle(analytic_signal), scale)
+
+    frequency = xr.Dataset(
+        {var: (time_dimension, f_instantaneous[i]) for i, var in enumerate(variables)},
+        coords={time_dimension: time[0:-1]},
+    )
 
     if to_pandas:
         frequency = frequency.to_pandas()
@@ -107,6 +289,45 @@ def instantaneous_frequency(
     return frequency
 
 
+def _dc_power_arrays(
+    voltage: xr.Dataset, current: xr.Dataset
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates DC power of each channel and gross power as NumPy arrays.
+    Channels are paired in the order the variables are assigned. Raises a
+    ValueError if the voltage and current indexes differ.
+
+    Parameters
+    -----------
+    voltage: xarray Dataset
+        Measured voltage [V] indexed by time
+
+    current: xarray Dataset
+        Measured current [A] indexed by time
+
+    Returns
+    --------
+    products: numpy array
+        DC power [W] of each channel, as [channel, time]
+
+    gross: numpy array
+        Gross DC power [W], the sum over channels
+    """
+    # Stacking the values pairs samples by position, so the indexes must match
+    try:
+        xr.align(voltage, current, join="exact")
+    except ValueError as err:
+        raise ValueError("current and voltage must have the same index") from err
+
+    # Stack channels as [channel, time] arrays
+    current_values = np.stack([current[var].values for var in current.data_vars])
+    voltage_values = np.stack([voltage[var].values for var in voltage.data_vars])
+
+    # Multiply current and voltage of every channel in one vectorized call
+    products = current_values * voltage_values
+    return products, products.sum(axis=0)
+
+
 def dc_power(
     voltage: Union[pd.Series, pd.DataFrame, xr.DataArray, xr.Dataset],
     current: Union[pd.Series, pd.DataFrame, xr.DataArray, xr.Dataset],
@@ -155,21 +376,13 @@ def dc_power(
     ):
         raise ValueError("current and voltage must have the same shape")
 
-    power_dc = xr.Dataset()
-    gross = None
+    template = current[list(current.data_vars)[0]]
+    products, gross = _dc_power_arrays(voltage, current)
 
-    # Multiply current and voltage variables together, in order they're assigned
-    for i, (current_var, voltage_var) in enumerate(
-        zip(current.data_vars, voltage.data_vars)
-    ):
-        temp = current[current_var] * voltage[voltage_var]
-        power_dc = power_dc.assign({f"{i}": temp})
-        if gross is None:
-            gross = temp
-        else:
-            gross = gross + temp
+    channels = {f"{i}": (template.dims, product) for i, product in enumerate(products)}
+    channels["Gross"] = (template.dims, gross)
 
-    power_dc = power_dc.assign({"Gross": gross})
+    power_dc = xr.Dataset(channels, coords=template.coords)
 
     if to_pandas:
         power_dc = power_dc.to_dataframe()
@@ -236,15 +449,15 @@ def ac_power_three_phase(
     if current.sizes != voltage.sizes:
         raise ValueError("current and voltage must be of the same size")
 
-    power = dc_power(voltage, current, to_pandas=False)["Gross"]
-    power.name = "Power"
-    power = (
-        power.to_dataset()
-    )  # force xr.DataArray to be consistently in xr.Dataset format
-    power_ac = np.abs(power) * power_factor
+    _, gross = _dc_power_arrays(voltage, current)
+    power = np.abs(gross) * power_factor
 
     if line_to_line:
-        power_ac = power_ac * np.sqrt(3)
+        power = power * np.sqrt(3)
+
+    # Keep output consistently in xr.Dataset format
+    template = current[list(current.data_vars)[0]]
+    power_ac = xr.Dataset({"Power": (template.dims, power)}, coords=template.coords)
 
     if to_pandas:
         power_ac = power_ac.to_pandas()
@@ -87,7 +87,7 @@ def harmonics(
     sample_spacing = 1.0 / freq
 
     # Loop through all variables in signal_data
-    harmonic_amplitudes = xr.Dataset()
+    amplitudes = {}
     for var in signal_data.data_vars:
         dataarray = signal_data[var]
         dataarray = dataarray.to_numpy()
@@ -95,12 +95,12 @@ def harmonics(
         frequency_bin_centers = fftpack.fftfreq(len(dataarray), d=sample_spacing)
         harmonics_amplitude = np.abs(np.fft.fft(dataarray, axis=0))
 
-        harmonic_amplitudes = harmonic_amplitudes.assign(
-            {var: (["frequency"], harmonics_amplitude)}
-        )
-        harmonic_amplitudes = harmonic_amplitudes.assign_coords(
-            {"frequency": frequency_bin_centers}
-        )
+        amplitudes[var] = (["frequency"], harmonics_amplitude)
+
+    # Build the Dataset once rather than reassigning it for every variable
+    harmonic_amplitudes = xr.Dataset(
+        amplitudes, coords={"frequency": frequency_bin_centers}
+    )
     harmonic_amplitudes = harmonic_amplitudes.sortby("frequency")
 
     if grid_freq == 60:
@@ -195,7 +195,7 @@ def harmonic_subgroups(
     harmonic_amplitudes = harmonic_amplitudes.sortby(frequency_dimension)
 
     # Loop through all variables in harmonics
-    subgroup_results = xr.Dataset()
+    subgroups = {}
     for var in harmonic_amplitudes.data_vars:
         dataarray = harmonic_amplitudes[var]
         subgroup = np.zeros(np.size(hertz))
@@ -207,8 +207,9 @@ def harmonic_subgroups(
             data_subset = dataarray.isel({frequency_dimension: [ind - 1, ind, ind + 1]})
             subgroup[ihz] = (data_subset**2).sum() ** 0.5
 
-        subgroup_results = subgroup_results.assign({var: (["frequency"], subgroup)})
-        subgroup_results = subgroup_results.assign_coords({"frequency": hertz})
+        subgroups[var] = (["frequency"], subgroup)
+
+    subgroup_results = xr.Dataset(subgroups, coords={"frequency": hertz})
 
     if to_pandas:
         subgroup_results = subgroup_results.to_pandas()
@@ -352,7 +353,7 @@ def interharmonics(
     harmonic_amplitudes = harmonic_amplitudes.sortby(frequency_dimension)
 
     # Loop through all variables in harmonic_amplitudes
-    interharmonic_groups = xr.Dataset()
+    interharmonic_subsets = {}
     for var in harmonic_amplitudes.data_vars:
         dataarray = harmonic_amplitudes[var]
         subset = np.zeros(np.size(hertz))
@@ -368,10 +369,11 @@ def interharmonics(
                 data = dataarray.isel({frequency_dimension: slice(ind + 1, ind + 7)})
                 subset[ihz] = (data**2).sum() ** 0.5
 
-        interharmonic_groups = interharmonic_groups.assign(
-            {var: (["frequency"], subset)}
-        )
-        interharmonic_groups = interharmonic_groups.assign_coords({"frequency": hertz})
+        interharmonic_subsets[var] = (["frequency"], subset)
+
+    interharmonic_groups = xr.Dataset(
+        interharmonic_subsets, coords={"frequency": hertz}
+    )
 
     if to_pandas:
         interharmonic_groups = interharmonic_groups.to_pandas()
@@ -5,6 +5,7 @@ from pandas.testing import assert_frame_equal
 from mhkit.wave import resource
 import mhkit.loads as loads
 import pandas as pd
+import xarray as xr
 from scipy import stats
 import numpy as np
 import unittest
@@ -436,6 +437,22 @@ class TestWDRT(unittest.TestCase):
             check_names=False,
         )
 
+    def test_mler_wave_amp_normalize_xarray(self):
+        wave_freq = np.linspace(0.0, 1, 500)
+        mler = pd.DataFrame(index=wave_freq)
+        mler["WaveSpectrum"] = self.mler["Res_Spec"].values
+        mler["Phase"] = self.mler["phase"].values
+        k = resource.wave_number(wave_freq, 70)
+        k = k.fillna(0)
+        mler_norm = loads.extreme.mler_wave_amp_normalize(
+            4.5 * 1.9, mler.to_xarray(), self.sim, k.k.values, to_pandas=False
+        )
+
+        assert isinstance(mler_norm, xr.Dataset)
+        assert_allclose(
+            mler_norm["WaveSpectrum"].values, self.mler["Norm_Spec"].values, atol=0.001
+        )
+
     def test_mler_export_time_series(self):
         wave_freq = np.linspace(0.0, 1, 500)
         mler = pd.DataFrame(index=wave_freq)
@@ -497,6 +514,38 @@ class TestWDRT(unittest.TestCase):
             ste = loads.extreme.ste(t, data, t_st, method)
             assert_allclose(ste.cdf(x), cdf_1)
 
+    def test_block_maxima_empty_block(self):
+        t_st = 10.0
+        # No samples between t=10 and t=20 leaves the second block empty
+        t = np.concatenate([np.arange(0.0, 10.0, 0.5), np.arange(20.0, 40.0, 0.5)])
+        data = np.sin(t)
+
+        with self.assertRaises(ValueError):
+            loads.extreme.block_maxima(t, data, t_st)
+
+    def test_peaks_over_threshold_no_storm_peaks(self):
+        # Monotonically decreasing peaks never cross the threshold upward
+        peaks = np.linspace(10, 1, 200)
+        over_threshold = loads.extreme.peaks._peaks_over_threshold(peaks, 0.5, 3.0)
+        self.assertEqual(over_threshold, [])
+
+    def test_shortterm_extreme_ppf(self):
+        methods = [
+            "peaks_weibull",
+            "peaks_weibull_tail_fit",
+            "peaks_over_threshold",
+        ]
+        filename = "time_series_for_extremes.txt"
+        data = np.loadtxt(os.path.join(datadir, filename))
+        t = data[:, 0]
+        data = data[:, 1]
+        t_st = 1.0 * 60 * 60
+        x = np.array([1.6, 1.8, 2.0])
+        for method in methods:
+            with self.subTest(method=method):
+                ste = loads.extreme.ste(t, data, t_st, method)
+                assert_allclose(ste.ppf(ste.cdf(x)), x)
+
     def test_automatic_threshold(self):
         filename = "data_loads_hs.csv"
         data = np.loadtxt(os.path.join(datadir, filename), delimiter=",")
@@ -505,6 +554,59 @@ class TestWDRT(unittest.TestCase):
         assert np.isclose(pct, 0.9913)
         assert np.isclose(threshold, 1.032092)
 
+    def test_automatic_threshold_pwm(self):
+        filename = "data_loads_hs.csv"
+        data = np.loadtxt(os.path.join(datadir, filename), delimiter=",")
+        years = 2.97
+        pct, threshold = loads.extreme.automatic_hs_threshold(
+            data, years, fit_method="pwm"
+        )
+        assert np.isclose(pct, 0.9909)
+        assert np.isclose(threshold, 1.031048)
+
+    def test_threshold_correlation_single_exceedance(self):
+        # A short record passes the rate check with only one storm peak
+        peaks = np.ones(10)
+        peaks[1] = 5.0
+        correlation_inputs = (
+            peaks,
+            0,
+            0.1,
+            np.sort(peaks),
+            np.linspace(0.05, 0.95, peaks.size),
+        )
+        for fit_method in ["mle", "pwm"]:
+            with self.subTest(fit_method=fit_method):
+                correlation = loads.extreme.peaks._threshold_correlation(
+                    0.5, correlation_inputs, fit_method=fit_method
+                )
+                self.assertIsNone(correlation)
+
+    def test_automatic_threshold_parallel(self):
+        filename = "data_loads_hs.csv"
+        data = np.loadtxt(os.path.join(datadir, filename), delimiter=",")
+        years = 2.97
+        pct, threshold = loads.extreme.automatic_hs_threshold(data, years, n_jobs=2)
+        assert np.isclose(pct, 0.9913)
+        assert np.isclose(threshold, 1.032092)
+
+        # The search range extends past the thresholds with enough peaks
+        rng = np.random.default_rng(1)
+        peaks = rng.weibull(1.5, 2000)
+        peaks[0] = 100
+        search_range = (0.990, 0.9999, 0.0009)
+        serial = loads.extreme.automatic_hs_threshold(peaks, 3.0, search_range, 1)
+        parallel = loads.extreme.automatic_hs_threshold(
+            peaks, 3.0, search_range, 1, n_jobs=2
+        )
+        assert_allclose(parallel, serial)
+        assert_allclose(serial, (0.9972, 3.344609), rtol=1e-6)
+
+    def test_automatic_threshold_fit_method_error(self):
+        data = np.random.rand(100)
+        with self.assertRaises(ValueError):
+            loads.extreme.automatic_hs_threshold(data, 2.97, fit_method="lsq")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
 from os.path import abspath, dirname, join, normpath, relpath
+from importlib.util import find_spec
 import mhkit.power as power
 import pandas as pd
 import xarray as xr
@@ -123,6 +124,30 @@ class TestDevice(unittest.TestCase):
         for i in freq.values:
             self.assertAlmostEqual(i[0], self.frequency, 1)
 
+    def test_instfreq_datetime_index(self):
+        # 10 s of the 60 Hz signal sampled at 1 kHz, indexed by datetime
+        n_samples = 10000
+        index = pd.date_range("2024-01-01", periods=n_samples, freq="1ms")
+        um = pd.Series(self.signal[:n_samples], index=index)
+
+        freq = power.characteristics.instantaneous_frequency(um)
+        # Skip the edges, where the analytic signal is distorted
+        np.testing.assert_allclose(freq.values[100:-100, 0], self.frequency, atol=1e-6)
+
+    def test_instfreq_backend_error(self):
+        um = pd.Series(self.signal, index=self.samples)
+
+        with self.assertRaises(ValueError):
+            power.characteristics.instantaneous_frequency(um, backend="cupy")
+
+    @unittest.skipUnless(find_spec("torch"), "requires PyTorch")
+    def test_instfreq_torch_backend(self):
+        um = pd.Series(self.signal, index=self.samples)
+
+        freq = power.characteristics.instantaneous_frequency(um)
+        freq_torch = power.characteristics.instantaneous_frequency(um, backend="torch")
+        np.testing.assert_allclose(freq_torch.values, freq.values, atol=0.1)
+
     def test_dc_power_pandas(self):
         current = pd.DataFrame(self.current_data, columns=["A1", "A2", "A3"])
         voltage = pd.DataFrame(self.voltage_data, columns=["V1", "V2", "V3"])
@@ -135,6 +160,17 @@ class TestDevice(unittest.TestCase):
         P_test = (self.current_data[:, 0] * self.voltage_data[:, 0]).sum()
         self.assertEqual(P.sum()["Gross"], P_test)
 
+    def test_dc_power_mismatched_index(self):
+        current = pd.DataFrame(self.current_data, columns=["A1", "A2", "A3"])
+        voltage = pd.DataFrame(
+            self.voltage_data, columns=["V1", "V2", "V3"], index=current.index + 2
+        )
+
+        with self.assertRaises(ValueError):
+            power.characteristics.dc_power(voltage, current)
+        with self.assertRaises(ValueError):
+            power.characteristics.ac_power_three_phase(voltage, current, 0.9)
+
     def test_dc_power_xarray(self):
         current = pd.DataFrame(self.current_data, columns=["A1", "A2", "A3"])
         voltage = pd.DataFrame(self.voltage_data, columns=["V1", "V2", "V3"])
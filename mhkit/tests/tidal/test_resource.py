@@ -53,6 +53,18 @@ class TestResource(unittest.TestCase):
 
         self.assertTrue(isfile(filename))
 
+    def test_plot_current_timeseries_ndarray(self):
+        series_ax = tidal.graphics.plot_current_timeseries(
+            self.data.d, self.data.s, 172
+        )
+        array_ax = tidal.graphics.plot_current_timeseries(
+            self.data.d.values, self.data.s, 172
+        )
+        np.testing.assert_allclose(
+            array_ax.lines[0].get_ydata(), series_ax.lines[0].get_ydata()
+        )
+        plt.close("all")
+
     def test_plot_joint_probability_distribution(self):
         filename = abspath(
             join(plotdir, "tidal_plot_joint_probability_distribution.png")
@@ -81,6 +93,42 @@ class TestResource(unittest.TestCase):
 
         self.assertTrue(isfile(filename))
 
+    def test_plot_rose_and_joint_probability_shared_histogram(self):
+        filename = abspath(join(plotdir, "tidal_plot_rose_shared_histogram.png"))
+        if isfile(filename):
+            os.remove(filename)
+
+        hist = tidal.resource._histogram(self.data.d, self.data.s, 1, 0.1)
+
+        fig = plt.figure()
+        ax = fig.add_subplot(121, polar=True)
+        tidal.graphics.plot_rose(self.data.d, self.data.s, 1, 0.1, ax=ax, hist=hist)
+        ax = fig.add_subplot(122, polar=True)
+        tidal.graphics.plot_joint_probability_distribution(
+            self.data.d, self.data.s, 1, 0.1, ax=ax, hist=hist
+        )
+        plt.savefig(f"{filename}")
+        plt.close()
+
+        self.assertTrue(isfile(filename))
+
+        with self.assertRaises(TypeError):
+            tidal.graphics.plot_rose(self.data.d, self.data.s, 1, 0.1, hist=hist[0])
+
+    def test_plot_rose_invalid_inputs(self):
+        velocities = self.data.s.copy()
+        velocities.iloc[0] = -0.1
+        with self.assertRaises(ValueError):
+            tidal.graphics.plot_rose(self.data.d, velocities, 1, 0.1)
+
+        directions = self.data.d.copy()
+        directions.iloc[0] = 361.0
+        with self.assertRaises(ValueError):
+            tidal.graphics.plot_rose(directions, self.data.s, 1, 0.1)
+
+        with self.assertRaises(ValueError):
+            tidal.graphics.plot_rose(self.data.d, self.data.s, 1, 0.1, flood=400)
+
     def test_tidal_phase_probability(self):
         filename = abspath(join(plotdir, "tidal_plot_tidal_phase_probability.png"))
         if isfile(filename):
@@ -109,6 +157,22 @@ class TestResource(unittest.TestCase):
 
         self.assertTrue(isfile(filename))
 
+    def test_tidal_phase_exceedance_xarray(self):
+        filename = abspath(
+            join(plotdir, "tidal_plot_tidal_phase_exceedance_xarray.png")
+        )
+        if isfile(filename):
+            os.remove(filename)
+
+        plt.figure()
+        tidal.graphics.tidal_phase_exceedance(
+            self.data.d.to_xarray(), self.data.s.to_xarray(), self.flood, self.ebb
+        )
+        plt.savefig(f"{filename}")
+        plt.close()
+
+        self.assertTrue(isfile(filename))
+
 
 if __name__ == "__main__":
     unittest.main()
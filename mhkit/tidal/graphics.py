@@ -1,13 +1,17 @@
+import math
 import numpy as np
-import bisect
-from scipy.interpolate import interpn as _interpn
-from scipy.interpolate import interp1d
+from scipy.interpolate import RegularGridInterpolator
 import matplotlib.pyplot as plt
-from mhkit.river.resource import exceedance_probability
+from matplotlib.patches import Patch
 from mhkit.tidal.resource import _histogram, _flood_or_ebb
 from mhkit.river.graphics import plot_velocity_duration_curve, _xy_plot
 from mhkit.utils import convert_to_dataarray
 
+# Cardinal direction theta ticks, measured clockwise from true north
+_BASE_TICK_DEGREES = np.array([0.0, 45.0, 90.0, 135.0, 180.0, 225.0, 270.0, 315.0])
+_BASE_TICK_RADIANS = _BASE_TICK_DEGREES * np.pi / 180.0
+_BASE_TICK_LABELS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+
 
 def _initialize_polar(ax=None, metadata=None, flood=None, ebb=None):
     """
@@ -30,9 +34,6 @@ def _initialize_polar(ax=None, metadata=None, flood=None, ebb=None):
     # Angles are measured clockwise from true north
     ax.set_theta_zero_location("N")
     ax.set_theta_direction(-1)
-    xticks = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-    # Polar plots do not have minor ticks, insert flood/ebb into major ticks
-    xtickDegrees = [0.0, 45.0, 90.0, 135.0, 180.0, 225.0, 270.0, 315.0]
     # Set title and metadata box
     if metadata != None:
         # Set the Title
@@ -54,33 +55,24 @@ def _initialize_polar(ax=None, metadata=None, flood=None, ebb=None):
             verticalalignment="top",
             bbox=dict(facecolor="none", edgecolor="k", pad=5),
         )
-    # If defined plot flood and ebb directions as major ticks
-    if flood != None:
-        # Get flood direction in degrees
-        floodDirection = flood
-        # Polar plots do not have minor ticks,
-        #    insert flood/ebb into major ticks
-        bisect.insort(xtickDegrees, floodDirection)
-        # Get location in list
-        idxFlood = xtickDegrees.index(floodDirection)
-        # Insert label at appropriate location
-        xticks[idxFlood:idxFlood] = ["\nFlood"]
-    if ebb != None:
-        # Get flood direction in degrees
-        ebbDirection = ebb
-        # Polar plots do not have minor ticks,
-        #    insert flood/ebb into major ticks
-        bisect.insort(xtickDegrees, ebbDirection)
-        # Get location in list
-        idxEbb = xtickDegrees.index(ebbDirection)
-        # Insert label at appropriate location
-        xticks[idxEbb:idxEbb] = ["\nEbb"]
-    ax.set_xticks(np.array(xtickDegrees) * np.pi / 180.0)
+    # Polar plots do not have minor ticks, insert flood/ebb into major ticks
+    xtick_radians = _BASE_TICK_RADIANS
+    xticks = list(_BASE_TICK_LABELS)
+    if flood != None or ebb != None:
+        xtick_degrees = _BASE_TICK_DEGREES
+        for direction, label in ((flood, "\nFlood"), (ebb, "\nEbb")):
+            if direction != None:
+                # Insert before any equal tick, matching its label location
+                idx = int(np.searchsorted(xtick_degrees, direction))
+                xtick_degrees = np.insert(xtick_degrees, idx, direction)
+                xticks.insert(idx, label)
+        xtick_radians = xtick_degrees * np.pi / 180.0
+    ax.set_xticks(xtick_radians)
     ax.set_xticklabels(xticks)
     return ax
 
 
-def _check_inputs(directions, velocities, flood, ebb):
+def _check_inputs(directions, velocities, flood, ebb, **bin_widths):
     """
     Runs checks on inputs for the graphics functions.
 
@@ -94,31 +86,75 @@ def _check_inputs(directions, velocities, flood, ebb):
         Direction in degrees added to theta ticks
     ebb: float
         Direction in degrees added to theta ticks
+    **bin_widths: float
+        Histogram bin widths keyed by argument name (e.g. width_dir),
+        each checked to be a non-negative int or float
     """
+    for name, width in bin_widths.items():
+        if not isinstance(width, (int, float)):
+            raise TypeError(f"{name} must be of type int or float")
+        if width < 0:
+            raise ValueError(f"{name} must be greater than 0")
 
     velocities = convert_to_dataarray(velocities)
     directions = convert_to_dataarray(directions)
 
     if len(velocities) != len(directions):
         raise ValueError("velocities and directions must have the same length")
-    if all(np.nan_to_num(velocities.values) < 0):
+    # Comparisons with NaN are False, so missing values pass these checks
+    if (velocities.values < 0).any():
         raise ValueError("All velocities must be positive")
-    if all(np.nan_to_num(directions.values) < 0) and all(
-        np.nan_to_num(directions.values) > 360
-    ):
+    if np.logical_or(directions.values < 0, directions.values > 360).any():
         raise ValueError("directions must be between 0 and 360 degrees")
     if not isinstance(flood, (int, float, type(None))):
         raise TypeError("flood must be of type int or float")
     if not isinstance(ebb, (int, float, type(None))):
         raise TypeError("ebb must be of type int or float")
     if flood is not None:
-        if (flood < 0) and (flood > 360):
+        if (flood < 0) or (flood > 360):
             raise ValueError("flood must be between 0 and 360 degrees")
     if ebb is not None:
-        if (ebb < 0) and (ebb > 360):
+        if (ebb < 0) or (ebb > 360):
             raise ValueError("ebb must be between 0 and 360 degrees")
 
 
+def _phase_exceedance_probability(velocities, is_ebb):
+    """
+    Calculates the exceedance probability of all, ebb and flood velocities
+    from a single sort of the velocities. Matches
+    mhkit.river.resource.exceedance_probability, with tied velocities
+    sharing their average rank.
+
+    Parameters
+    ----------
+    velocities: array-like
+        Time-series of speeds [m/s]
+    is_ebb: numpy array
+        Boolean array, true where the velocity is in the ebb phase
+
+    Returns
+    -------
+    exceedance: list
+        (speeds, F) pairs for all, ebb and flood velocities, where speeds
+        are the sorted unique velocities of the phase and F their
+        exceedance probability [%]
+    """
+    speeds, inverse = np.unique(np.asarray(velocities), return_inverse=True)
+    counts_ebb = np.bincount(inverse.ravel(), weights=is_ebb, minlength=len(speeds))
+    counts_all = np.bincount(inverse.ravel(), minlength=len(speeds))
+
+    exceedance = []
+    for counts in (counts_all, counts_ebb, counts_all - counts_ebb):
+        present = counts > 0
+        counts = counts[present]
+        n_samples = counts.sum()
+        # Average ascending rank of each group of tied velocities
+        rank = np.cumsum(counts) - counts + (counts + 1) / 2
+        F = 100 * (n_samples - rank + 1) / (n_samples + 1)
+        exceedance.append((speeds[present], F))
+    return exceedance
+
+
 def plot_rose(
     directions,
     velocities,
@@ -128,6 +164,7 @@ def plot_rose(
     metadata=None,
     flood=None,
     ebb=None,
+    hist=None,
 ):
     """
     Creates a polar histogram. Direction angles from binned histogram must
@@ -152,54 +189,59 @@ def plot_rose(
         Direction in degrees added to theta ticks
     ebb: float
         Direction in degrees added to theta ticks
+    hist: tuple (optional)
+        Precomputed (H, dir_edges, vel_edges) joint probability histogram
+        of directions and velocities binned by width_dir and width_vel,
+        with H in [%]. Passing the same histogram to plot_rose and
+        plot_joint_probability_distribution avoids binning the data twice.
+        Default None computes it from the data.
     Returns
     -------
     ax: figure
         Water current rose plot
     """
 
-    _check_inputs(directions, velocities, flood, ebb)
-
-    if not isinstance(width_dir, (int, float)):
-        raise TypeError("width_dir must be of type int or float")
-    if not isinstance(width_vel, (int, float)):
-        raise TypeError("width_vel must be of type int or float")
-    if width_dir < 0:
-        raise ValueError("width_dir must be greater than 0")
-    if width_vel < 0:
-        raise ValueError("width_vel must be greater than 0")
+    _check_inputs(
+        directions, velocities, flood, ebb, width_dir=width_dir, width_vel=width_vel
+    )
+    if hist is not None and not (isinstance(hist, (tuple, list)) and len(hist) == 3):
+        raise TypeError("hist must be a tuple of (H, dir_edges, vel_edges)")
 
     # Calculate the 2D histogram
-    H, dir_edges, vel_edges = _histogram(directions, velocities, width_dir, width_vel)
+    if hist is None:
+        hist = _histogram(directions, velocities, width_dir, width_vel)
+    H, dir_edges, vel_edges = hist
     # Determine number of bins
     dir_bins = H.shape[0]
     vel_bins = H.shape[1]
     # Create the angles
-    thetas = np.arange(0, 2 * np.pi, 2 * np.pi / dir_bins)
+    thetas = np.arange(dir_bins) * (2 * np.pi / dir_bins)
     # Initialize the polar polt
     ax = _initialize_polar(ax=ax, metadata=metadata, flood=flood, ebb=ebb)
     # Set bar color based on wind speed
     colors = plt.cm.viridis(np.linspace(0, 1.0, vel_bins))
     # Set the current speed bin label names
-    # Calculate the 2D histogram
     labels = [f"{i:.1f}-{j:.1f}" for i, j in zip(vel_edges[:-1], vel_edges[1:])]
-    # Initialize the vertical-offset (polar radius) for the stacked bar chart.
-    r_offset = np.zeros(dir_bins)
-    for vel_bin in range(vel_bins):
-        # Plot fist set of bars in all directions
-        ax.bar(
-            thetas,
-            H[:, vel_bin],
-            width=(2 * np.pi / dir_bins),
-            bottom=r_offset,
-            color=colors[vel_bin],
-            label=labels[vel_bin],
-        )
-        # Increase the radius offset in all directions
-        r_offset = r_offset + H[:, vel_bin]
+    # Stack each velocity bin on the bins below it (polar radius offset)
+    r_offset = np.zeros_like(H)
+    np.cumsum(H[:, :-1], axis=1, out=r_offset[:, 1:])
+    # Plot the bars of every velocity bin in all directions in one call,
+    # ordered by velocity bin then direction
+    ax.bar(
+        np.tile(thetas, vel_bins),
+        H.T.ravel(),
+        width=(2 * np.pi / dir_bins),
+        bottom=r_offset.T.ravel(),
+        color=np.repeat(colors, dir_bins, axis=0),
+    )
     # Add the a legend for current speed bins
+    handles = [Patch(color=color, label=label) for color, label in zip(colors, labels)]
     plt.legend(
-        loc="best", title="Velocity bins [m/s]", bbox_to_anchor=(1.29, 1.00), ncol=1
+        handles=handles,
+        loc="best",
+        title="Velocity bins [m/s]",
+        bbox_to_anchor=(1.29, 1.00),
+        ncol=1,
     )
     # Get the r-ticks (polar y-ticks)
     yticks = plt.yticks()
@@ -219,6 +261,7 @@ def plot_joint_probability_distribution(
     metadata=None,
     flood=None,
     ebb=None,
+    hist=None,
 ):
     """
     Creates a polar histogram. Direction angles from binned histogram must
@@ -243,25 +286,28 @@ def plot_joint_probability_distribution(
         Direction in degrees added to theta ticks
     ebb: float
         Direction in degrees added to theta ticks
+    hist: tuple (optional)
+        Precomputed (H, dir_edges, vel_edges) joint probability histogram
+        of directions and velocities binned by width_dir and width_vel,
+        with H in [%]. Passing the same histogram to plot_rose and
+        plot_joint_probability_distribution avoids binning the data twice.
+        Default None computes it from the data.
     Returns
     -------
     ax: figure
         Joint probability distribution
     """
 
-    _check_inputs(directions, velocities, flood, ebb)
-
-    if not isinstance(width_dir, (int, float)):
-        raise TypeError("width_dir must be of type int or float")
-    if not isinstance(width_vel, (int, float)):
-        raise TypeError("width_vel must be of type int or float")
-    if width_dir < 0:
-        raise ValueError("width_dir must be greater than 0")
-    if width_vel < 0:
-        raise ValueError("width_vel must be greater than 0")
+    _check_inputs(
+        directions, velocities, flood, ebb, width_dir=width_dir, width_vel=width_vel
+    )
+    if hist is not None and not (isinstance(hist, (tuple, list)) and len(hist) == 3):
+        raise TypeError("hist must be a tuple of (H, dir_edges, vel_edges)")
 
     # Calculate the 2D histogram
-    H, dir_edges, vel_edges = _histogram(directions, velocities, width_dir, width_vel)
+    if hist is None:
+        hist = _histogram(directions, velocities, width_dir, width_vel)
+    H, dir_edges, vel_edges = hist
     # Initialize the polar polt
     ax = _initialize_polar(ax=ax, metadata=metadata, flood=flood, ebb=ebb)
     # Set the current speed bin label names
@@ -275,13 +321,13 @@ def plot_joint_probability_distribution(
     dir_bins[-1] = dir_edges[-1]
     vel_bins[-1] = vel_edges[-1]
     # Interpolate the bins back to specific data points
-    z = _interpn(
+    z = RegularGridInterpolator(
         (dir_bins, vel_bins),
         H,
-        np.vstack([directions, velocities]).T,
-        method="splinef2d",
+        method="linear",
         bounds_error=False,
-    )
+        fill_value=np.nan,
+    )(np.column_stack([directions, velocities]))
     # Plot the most probable data last
     idx = z.argsort()
     # Convert to radians and order points by probability
@@ -335,9 +381,11 @@ def plot_current_timeseries(
         raise ValueError("principal_direction must be between 0 and 360 degrees")
 
     # Rotate coordinate system by supplied principal_direction
-    principal_directions = directions - principal_direction
-    # Calculate the velocity
-    velocity = velocities * np.cos(np.pi / 180 * principal_directions)
+    velocity = np.asarray(directions, dtype=np.float64) - principal_direction
+    # Calculate the velocity, reusing the rotated directions array in place
+    np.deg2rad(velocity, out=velocity)
+    np.cos(velocity, out=velocity)
+    np.multiply(np.asarray(velocities), velocity, out=velocity)
     # Call on standard xy plotting
     ax = _xy_plot(
         velocities.index,
@@ -377,9 +425,7 @@ def tidal_phase_probability(directions, velocities, flood, ebb, bin_size=0.1, ax
     ax: figure
     """
 
-    _check_inputs(directions, velocities, flood, ebb)
-    if bin_size < 0:
-        raise ValueError("bin_size must be greater than 0")
+    _check_inputs(directions, velocities, flood, ebb, bin_size=bin_size)
 
     if ax == None:
         fig, ax = plt.subplots(figsize=(12, 8))
@@ -389,9 +435,13 @@ def tidal_phase_probability(directions, velocities, flood, ebb, bin_size=0.1, ax
     decimals = round(bin_size / 0.1)
     N_bins = int(round(velocities.max(), decimals) / bin_size)
 
-    H, bins = np.histogram(velocities, bins=N_bins)
-    H_ebb, bins1 = np.histogram(velocities[isEbb], bins=bins)
-    H_flood, bins2 = np.histogram(velocities[~isEbb], bins=bins)
+    # Bin velocities by speed and tidal phase in one pass (flood column 0, ebb 1)
+    H_phase, bins, _ = np.histogram2d(
+        velocities, isEbb, bins=[N_bins, [-0.5, 0.5, 1.5]]
+    )
+    H_flood = H_phase[:, 0]
+    H_ebb = H_phase[:, 1]
+    H = H_flood + H_ebb
 
     p_ebb = H_ebb / H
     p_flood = H_flood / H
@@ -463,36 +513,32 @@ def tidal_phase_exceedance(directions, velocities, flood, ebb, bin_size=0.1, ax=
     ax: figure
     """
 
-    _check_inputs(directions, velocities, flood, ebb)
-    if bin_size < 0:
-        raise ValueError("bin_size must be greater than 0")
+    _check_inputs(directions, velocities, flood, ebb, bin_size=bin_size)
 
     if ax == None:
         fig, ax = plt.subplots(figsize=(12, 8))
 
     isEbb = _flood_or_ebb(directions, flood, ebb)
 
-    s_ebb = velocities[isEbb]
-    s_flood = velocities[~isEbb]
-
-    F = exceedance_probability(velocities)["F"]
-    F_ebb = exceedance_probability(s_ebb)["F"]
-    F_flood = exceedance_probability(s_flood)["F"]
-
-    decimals = round(bin_size / 0.1)
-    s_new = np.arange(
-        np.around(velocities.min(), decimals),
-        np.around(velocities.max(), decimals) + bin_size,
-        bin_size,
+    (s_total, F), (s_ebb, F_ebb), (s_flood, F_flood) = _phase_exceedance_probability(
+        velocities, isEbb
     )
 
-    f_total = interp1d(velocities, F, bounds_error=False)
-    f_ebb = interp1d(s_ebb, F_ebb, bounds_error=False)
-    f_flood = interp1d(s_flood, F_flood, bounds_error=False)
-
-    F_total = f_total(s_new)
-    F_ebb = f_ebb(s_new)
-    F_flood = f_flood(s_new)
+    decimals = round(bin_size / 0.1)
+    s_min = round(float(velocities.min()), decimals)
+    s_max = round(float(velocities.max()), decimals)
+    # Whole number of bins covering [s_min, s_max], ignoring round-off in the ratio
+    N_bins = math.ceil(round((s_max - s_min) / bin_size, 6))
+    s_end = s_min + N_bins * bin_size
+    if math.isclose(s_end, s_max):
+        # End exactly on the maximum so it is not dropped as out of range
+        s_end = s_max
+    s_new = np.linspace(s_min, s_end, N_bins + 1)
+
+    # Speeds are sorted, interpolate linearly with NaN outside the data range
+    F_total = np.interp(s_new, s_total, F, left=np.nan, right=np.nan)
+    F_ebb = np.interp(s_new, s_ebb, F_ebb, left=np.nan, right=np.nan)
+    F_flood = np.interp(s_new, s_flood, F_flood, left=np.nan, right=np.nan)
 
     F_max_total = np.nanmax(F_ebb) + np.nanmax(F_flood)
 
@@ -0,0 +1,33 @@
+"""
+This module provides the optional numba compiler used by MHKiT's compiled
+helpers. numba is not a required dependency; when it is not installed,
+`njit` leaves functions as plain Python, `prange` behaves as `range` and
+`HAS_NUMBA` is False so callers can choose a vectorized NumPy path instead.
+"""
+
+__all__ = ["HAS_NUMBA", "njit", "prange"]
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """
+        No-op stand-in for numba.njit when numba is not installed.
+
+        Supports both the bare `@njit` and the `@njit(...)` forms.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+    def prange(*args):
+        """Stand-in for numba.prange when numba is not installed."""
+        return range(*args)
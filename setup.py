@@ -37,6 +37,7 @@ DEPENDENCIES = [
     "pytz",
     "bottleneck",
     "beautifulsoup4",
+    "joblib",
 ]
 
 LONG_DESCRIPTION = """